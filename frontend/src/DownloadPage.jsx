@@ -5,7 +5,7 @@ const DataDownloadPage = () => {
   const [error, setError] = useState(null);
 
   // Replace with your actual Azure Blob Storage URL
-  const DOWNLOAD_URL = `https://saumayy.blob.core.windows.net/saumayycontainer/data_export.csv`;
+  const DOWNLOAD_URL = `https://saumayy.blob.core.windows.net/saumayycontainer/data_export.csv.gz`;
 
   const handleDownload = async () => {
     setDownloading(true);
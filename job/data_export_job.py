@@ -1,15 +1,211 @@
 import os
+import atexit
+import bson
+import csv
+import functools
+import gzip
+import io
+import numpy as np
 import psycopg2
-from pymongo import MongoClient
+import pyarrow as pa
+from pymongo import IndexModel, InsertOne, MongoClient
 import pandas as pd
-from azure.storage.blob import BlobServiceClient
-from datetime import datetime
+from azure.storage.blob import BlobServiceClient, BlobType, ContentSettings
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, datetime, time
+from urllib.parse import quote
 import json
 from dotenv import load_dotenv
 
+# Optional accelerators, not in requirements.txt: install them to enable the
+# Arrow-based paths. Without them the job streams through psycopg2 and PyMongo
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+try:
+    import pymongoarrow.api as pma
+except ImportError:
+    pma = None
+
 
 load_dotenv()
 
+# PostgreSQL json/jsonb type OIDs; psycopg2 parses these, connectorx doesn't
+PG_JSON_TYPE_OIDS = (114, 3802)
+
+# Rows fetched per round trip from the psycopg2 server-side cursor
+PG_FETCH_SIZE = 10_000
+
+# Number of documents sent per bulk_write round trip
+MONGO_INSERT_BATCH_SIZE = 10_000
+
+# Number of documents fetched per cursor batch when reading back
+MONGO_FETCH_BATCH_SIZE = 10_000
+
+# Azure block upload tuning: exports above the single-put limit are split
+# into blocks that are uploaded in parallel
+AZURE_MAX_BLOCK_SIZE = 8 * 1024 * 1024
+AZURE_MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024
+AZURE_CONNECTION_DATA_BLOCK_SIZE = 1024 * 1024
+AZURE_MAX_CONCURRENCY = 8
+
+# Supported export formats: (filename, blob content type, content encoding)
+EXPORT_FORMATS = {
+    "feather": ("data_export.feather", "application/vnd.apache.arrow.file", None),
+    "csv": ("data_export.csv.gz", "text/csv", "gzip"),
+}
+
+# Rows formatted per write when building the CSV export
+CSV_CHUNK_ROWS = 10_000
+
+# gzip level 1 is nearly as fast to write as raw CSV at a fraction of the size
+CSV_GZIP_LEVEL = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _mongo_client(uri):
+    """Return a pooled MongoClient shared by every call using this URI"""
+    if not bson.has_c():
+        print("⚠ PyMongo C extensions not available, BSON encoding will be slow")
+    client = MongoClient(uri, w=1, compressors="zstd", maxPoolSize=32, retryWrites=True)
+    atexit.register(client.close)
+    return client
+
+
+@functools.lru_cache(maxsize=None)
+def _blob_service(connection_string):
+    """Return a BlobServiceClient shared by every upload to this account"""
+    return BlobServiceClient.from_connection_string(
+        connection_string,
+        connection_timeout=30,
+        max_block_size=AZURE_MAX_BLOCK_SIZE,
+        max_single_put_size=AZURE_MAX_SINGLE_PUT_SIZE,
+        connection_data_block_size=AZURE_CONNECTION_DATA_BLOCK_SIZE,
+    )
+
+
+def _date_to_datetime(value):
+    # Convert date to datetime (at midnight)
+    return datetime.combine(value, time.min)
+
+
+def _nan_to_none(value):
+    return None if value != value else value
+
+
+def _walk_dict(value):
+    normalize = normalize_value
+    return {key: normalize(item) for key, item in value.items()}
+
+
+def _walk_list(value):
+    normalize = normalize_value
+    return [normalize(item) for item in value]
+
+
+def _walk_array(value):
+    return _walk_list(value.tolist())
+
+
+def _numpy_to_native(value):
+    # numpy scalars would push BSON encoding off the C fast path
+    return _nan_to_none(value.item())
+
+
+# Handlers keyed by exact type; type(date) excludes datetime subclasses
+_NORMALIZE_DISPATCH = {
+    dict: _walk_dict,
+    list: _walk_list,
+    tuple: _walk_list,
+    np.ndarray: _walk_array,
+    date: _date_to_datetime,
+    float: _nan_to_none,
+    np.float64: _numpy_to_native,
+    np.float32: _numpy_to_native,
+    np.int64: _numpy_to_native,
+    np.int32: _numpy_to_native,
+    np.bool_: _numpy_to_native,
+    type(pd.NaT): lambda value: None,
+}
+
+
+def normalize_value(value):
+    """Recursively make a cell value BSON-friendly (date -> datetime, NaN -> None)"""
+    handler = _NORMALIZE_DISPATCH.get(type(value))
+    return handler(value) if handler is not None else value
+
+
+def normalize_frame(df, synced_at):
+    """Return a BSON-friendly copy of df with a synced_at column added"""
+    # Convert date columns to datetime (at midnight) and Decimal columns to
+    # float, a whole column at a time, so every value is a native BSON type
+    # and encoding stays on the C fast path
+    converted = {}
+    for col in df.select_dtypes(include="object").columns:
+        kind = pd.api.types.infer_dtype(df[col], skipna=True)
+        if kind == "date":
+            try:
+                converted[col] = pd.to_datetime(df[col])
+            except pd.errors.OutOfBoundsDatetime:
+                # Sentinel dates like 9999-12-31 don't fit datetime64[ns]
+                converted[col] = df[col].map(normalize_value)
+        elif kind == "datetime":
+            # Aware datetimes (mixed offsets): to naive UTC, as below
+            try:
+                converted[col] = pd.to_datetime(df[col], utc=True).dt.tz_localize(None)
+            except (ValueError, TypeError):
+                pass  # out of range for datetime64, left as-is
+        elif kind == "decimal":
+            converted[col] = df[col].astype(float)
+        elif kind.startswith("mixed"):
+            # Nested values (array/JSON columns) still need a walk so dates
+            # and NaN inside lists and dicts are converted too
+            converted[col] = df[col].map(normalize_value)
+
+    # MongoDB stores datetimes as naive UTC, so timezone-aware columns (e.g.
+    # timestamptz read with a non-UTC session timezone) are converted the same
+    # way; the export then carries the values a MongoDB read-back would give
+    for col in df.select_dtypes(include="datetimetz").columns:
+        converted[col] = df[col].dt.tz_convert("UTC").dt.tz_localize(None)
+
+    # assign() returns a new frame, so the caller's DataFrame is untouched
+    df = df.assign(**converted)
+    df["synced_at"] = synced_at
+    return df
+
+
+def _cell_to_text(value):
+    if value is None or value != value:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def write_csv(df, file_obj, overrides=None):
+    """Write a DataFrame as CSV to an open text file, one row chunk at a time"""
+    # overrides swaps in pre-formatted columns by name without copying df
+    overrides = overrides or {}
+    columns = [overrides.get(name, col) for name, col in df.items()]
+
+    csv.writer(file_obj, lineterminator="\n").writerow(df.columns)
+    for start in range(0, len(df), CSV_CHUNK_ROWS):
+        values = []
+        for col in columns:
+            col = col.iloc[start : start + CSV_CHUNK_ROWS]
+            if col.hasnans:
+                # NaN/NaT become None, which the csv module writes as an empty
+                # field
+                col = col.astype(object).where(col.notna(), None)
+            values.append(col.tolist())
+
+        # Only one chunk of rows is held as Python objects and text at a time
+        buf = io.StringIO()
+        csv.writer(buf, lineterminator="\n").writerows(zip(*values))
+        file_obj.write(buf.getvalue())
+
 
 class DataExportJob:
     def __init__(self):
@@ -28,12 +224,30 @@ class DataExportJob:
         # Azure Blob Storage configuration
         self.azure_connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
         self.container_name = os.environ.get("AZURE_CONTAINER_NAME")
-        self.blob_name = "data_export.csv"  # Fixed filename for consistent download URL
 
-    def fetch_from_postgres(self):
-        """Fetch data from PostgreSQL database"""
-        print("Connecting to PostgreSQL...")
-        conn = psycopg2.connect(
+        # Export configuration (feather by default, csv for legacy consumers)
+        self.export_format = os.environ.get("EXPORT_FORMAT", "feather").lower()
+        if self.export_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported EXPORT_FORMAT '{self.export_format}', "
+                f"expected one of: {', '.join(EXPORT_FORMATS)}"
+            )
+        # Fixed filename for consistent download URL
+        self.blob_name, self.content_type, self.content_encoding = EXPORT_FORMATS[
+            self.export_format
+        ]
+
+    def postgres_dsn(self):
+        """Build a PostgreSQL connection URI from the PG_* settings"""
+        return (
+            f"postgresql://{quote(self.pg_user or '', safe='')}:"
+            f"{quote(self.pg_password or '', safe='')}@"
+            f"{self.pg_host}:{self.pg_port}/{self.pg_database}"
+        )
+
+    def connect_postgres(self):
+        """Open a psycopg2 connection from the PG_* settings"""
+        return psycopg2.connect(
             host=self.pg_host,
             port=self.pg_port,
             database=self.pg_database,
@@ -41,147 +255,276 @@ class DataExportJob:
             password=self.pg_password,
         )
 
+    def postgres_json_columns(self, query):
+        """Return the names of json/jsonb columns in the query's result"""
+        conn = self.connect_postgres()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT * FROM ({query}) AS q LIMIT 0")
+                return [
+                    desc.name
+                    for desc in cur.description
+                    if desc.type_code in PG_JSON_TYPE_OIDS
+                ]
+        finally:
+            conn.close()
+
+    def fetch_from_postgres(self):
+        """Fetch data from PostgreSQL database"""
         # Modify this query based on your data structure
         query = """
             SELECT * FROM public.customers
             ORDER BY id ASC LIMIT 10000
         """
 
-        print("Fetching data from PostgreSQL...")
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-
-        print(f"Fetched 200000 records from PostgreSQL")
-        return df
-
-    def convert_dates_to_datetime(self, obj):
-        """Recursively convert date objects to datetime objects for MongoDB compatibility"""
-        import datetime as dt
-
-        if isinstance(obj, dict):
-            return {
-                key: self.convert_dates_to_datetime(value) for key, value in obj.items()
-            }
-        elif isinstance(obj, list):
-            return [self.convert_dates_to_datetime(item) for item in obj]
-        elif isinstance(obj, dt.date) and not isinstance(obj, dt.datetime):
-            # Convert date to datetime (at midnight)
-            return dt.datetime.combine(obj, dt.time.min)
-        elif pd.isna(obj):
-            # Convert pandas NaN/NaT to None
-            return None
+        if cx is not None:
+            # Columnar fetch straight into Arrow, converted without copies.
+            # Not partitioned: each partition would re-run the ORDER BY ...
+            # LIMIT subquery and rows would lose their id order
+            print("Fetching data from PostgreSQL via connectorx...")
+            json_cols = self.postgres_json_columns(query)
+            table = cx.read_sql(self.postgres_dsn(), query, return_type="arrow")
+
+            # Match the types psycopg2 produces: NUMERIC as float (like
+            # read_sql_query's coerce_float) and json/jsonb parsed
+            table = table.cast(
+                pa.schema(
+                    [
+                        (
+                            field.with_type(pa.float64())
+                            if pa.types.is_decimal(field.type)
+                            else field
+                        )
+                        for field in table.schema
+                    ]
+                )
+            )
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            for col in json_cols:
+                df[col] = df[col].map(
+                    lambda v: json.loads(v) if isinstance(v, str) else v
+                )
         else:
-            return obj
+            print("Connecting to PostgreSQL...")
+            conn = self.connect_postgres()
+
+            # Stream through a server-side cursor so libpq never buffers the
+            # whole result client-side
+            print("Fetching data from PostgreSQL...")
+            try:
+                with conn.cursor(name="export_cur") as cur:
+                    cur.itersize = PG_FETCH_SIZE
+                    cur.execute(query)
+                    chunks = []
+                    while rows := cur.fetchmany(PG_FETCH_SIZE):
+                        chunks.append(
+                            pd.DataFrame.from_records(rows, coerce_float=True)
+                        )
+                    columns = [desc.name for desc in cur.description]
+            finally:
+                conn.close()
+
+            if chunks:
+                # Each chunk infers its own dtypes: a chunk that is all NULL in
+                # a nullable int/NUMERIC column comes back as object and would
+                # leave the whole column object after concat, so re-infer to
+                # get the dtypes a single whole-result read would give
+                df = pd.concat(chunks, ignore_index=True).infer_objects()
+                df.columns = columns
+            else:
+                df = pd.DataFrame(columns=columns)
+
+        print(f"Fetched {len(df)} records from PostgreSQL")
+        return df
 
     def save_to_mongodb(self, df):
-        """Save data to MongoDB collection"""
+        """Save normalized data (see normalize_frame) to MongoDB collection"""
         print("Connecting to MongoDB...")
-        client = MongoClient(self.mongo_uri)
+        client = _mongo_client(self.mongo_uri)
         db = client[self.mongo_db]
-        collection = db[self.mongo_collection]
-
-        # Clear existing data (optional - remove if you want to append)
-        collection.delete_many({})
-        print("Cleared existing MongoDB collection")
 
-        # Convert DataFrame to dictionary records
-        records = df.to_dict("records")
+        live = db[self.mongo_collection]
 
-        # Process each record to handle date conversions and add metadata
-        processed_records = []
-        for record in records:
-            # Convert all date objects to datetime
-            processed_record = self.convert_dates_to_datetime(record)
-
-            # Add timestamp
-            processed_record["synced_at"] = datetime.utcnow()
-
-            processed_records.append(processed_record)
-
-        # Insert into MongoDB
-        if processed_records:
-            result = collection.insert_many(processed_records)
-            print(f"Inserted 200000 records into MongoDB")
-        else:
+        if df.empty:
+            # Keep the collection itself (indexes, validator) and just empty it
+            live.delete_many({})
+            print("Cleared existing MongoDB collection")
             print("No records to insert")
-
-        client.close()
+            return
+
+        # Replace existing data: load a staging collection and swap it in
+        # with a rename, instead of deleting documents one by one (optional -
+        # insert into db[self.mongo_collection] if you want to append)
+        staging_name = f"{self.mongo_collection}_staging"
+        db.drop_collection(staging_name)  # leftover from an interrupted run
+
+        # Create the staging collection with the live collection's options
+        # (validator, collation, ...) so the swap doesn't strip them
+        live_info = next(
+            db.list_collections(filter={"name": self.mongo_collection}), None
+        )
+        options = live_info.get("options", {}) if live_info else {}
+        staging = db.create_collection(staging_name, **options)
+
+        # Convert pandas NaN/NaT to None and build the dictionary records
+        df = df.astype(object).where(df.notna(), None)
+        processed_records = df.to_dict("records")
+
+        # Insert into MongoDB in unordered bulk batches
+        for i in range(0, len(processed_records), MONGO_INSERT_BATCH_SIZE):
+            chunk = processed_records[i : i + MONGO_INSERT_BATCH_SIZE]
+            staging.bulk_write(
+                [InsertOne(doc) for doc in chunk],
+                ordered=False,
+                bypass_document_validation=True,
+            )
+        print(f"Inserted {len(df)} records into MongoDB")
+
+        # Rebuild the live collection's secondary indexes on the staged data
+        # (building after the load is cheaper than maintaining them per insert)
+        indexes = [
+            IndexModel(
+                list(index["key"].items()),
+                **{k: v for k, v in index.items() if k not in ("v", "key", "ns")},
+            )
+            for index in live.list_indexes()
+            if index["name"] != "_id_"
+        ]
+        if indexes:
+            staging.create_indexes(indexes)
+            print(f"Recreated {len(indexes)} indexes on staged data")
+
+        # Atomically replace the live collection with the staged data
+        staging.rename(self.mongo_collection, dropTarget=True)
+        print("Swapped staged data into MongoDB collection")
 
     def fetch_from_mongodb(self):
         """Fetch data from MongoDB collection for export"""
         print("Fetching data from MongoDB for export...")
-        client = MongoClient(self.mongo_uri)
+        client = _mongo_client(self.mongo_uri)
         db = client[self.mongo_db]
         collection = db[self.mongo_collection]
 
-        # Fetch all documents from MongoDB
-        documents = list(collection.find())
+        # Leave out MongoDB's _id field (it's not CSV-friendly)
+        projection = {"_id": 0}
+
+        if pma is not None:
+            # Decode BSON straight into Arrow columns
+            table = pma.find_arrow_all(
+                collection,
+                {},
+                projection=projection,
+                batch_size=MONGO_FETCH_BATCH_SIZE,
+            )
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+        else:
+            # Stream the cursor into a DataFrame in batches
+            cursor = collection.find(
+                {}, projection=projection, batch_size=MONGO_FETCH_BATCH_SIZE
+            )
+            df = pd.DataFrame.from_records(cursor)
 
-        if not documents:
+        if df.empty:
             print("⚠ No documents found in MongoDB collection")
-            client.close()
             return pd.DataFrame()
 
-        print(f"Fetched 200000 records from MongoDB")
-
-        # Convert to DataFrame
-        df = pd.DataFrame(documents)
-
-        # Remove MongoDB's _id field (it's not CSV-friendly)
-        if "_id" in df.columns:
-            df = df.drop("_id", axis=1)
-
-        client.close()
+        print(f"Fetched {len(df)} records from MongoDB")
         return df
 
     def export_to_csv(self, df):
-        """Export data to CSV file from MongoDB data"""
-        print("Exporting MongoDB data to CSV...")
+        """Export data to an in-memory Feather (default) or CSV buffer"""
+        print(f"Exporting data to {self.export_format}...")
 
         if df.empty:
-            print("⚠ DataFrame is empty, cannot export CSV")
+            print(f"⚠ DataFrame is empty, cannot export {self.export_format}")
             return None
 
-        csv_filename = "data_export.csv"
-
-        # Convert datetime columns to ISO format strings
-        df_copy = df.copy()
-        for col in df_copy.columns:
-            # Handle datetime objects
-            if pd.api.types.is_datetime64_any_dtype(df_copy[col]):
-                df_copy[col] = df_copy[col].dt.strftime("%Y-%m-%d %H:%M:%S")
-            # Handle any remaining date/datetime objects
-            elif df_copy[col].dtype == "object":
-                df_copy[col] = df_copy[col].apply(
+        buf = io.BytesIO()
+
+        if self.export_format == "feather":
+            # Columnar binary export: no per-cell string formatting needed,
+            # except for mixed/nested object columns (JSON and array cells).
+            # Arrow either rejects those (cells of differing types) or turns
+            # dict cells into structs holding every key seen in the column,
+            # so they are written as text instead: JSON for lists and dicts,
+            # str() for other values, like the CSV export
+            overrides = {
+                col: df[col].map(_cell_to_text)
+                for col in df.select_dtypes(include="object").columns
+                if pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+            }
+            df.assign(**overrides).reset_index(drop=True).to_feather(
+                buf, compression="zstd", compression_level=3
+            )
+            buf.seek(0)
+            print(f"✓ Data exported to {self.blob_name}")
+            print(f"  - Rows: {len(df)}")
+            print(f"  - Columns: {len(df.columns)}")
+            return buf
+
+        # Format datetime columns as strings, one Series at a time; only the
+        # touched columns are allocated, the frame itself is not copied
+        overrides = {}
+        for col in df.select_dtypes(include=["datetime64", "datetimetz"]).columns:
+            overrides[col] = df[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Handle object columns holding date/datetime values; other object
+        # columns are left for the csv writer to stringify as before
+        for col in df.select_dtypes(include="object").columns:
+            kind = pd.api.types.infer_dtype(df[col], skipna=True)
+            if kind not in ("date", "datetime"):
+                continue
+            fmt = "%Y-%m-%d" if kind == "date" else "%Y-%m-%d %H:%M:%S"
+            try:
+                overrides[col] = pd.to_datetime(df[col]).dt.strftime(fmt)
+            except (ValueError, TypeError):
+                # Mixed timezones can't share one datetime64 dtype
+                overrides[col] = df[col].map(
                     lambda x: x.isoformat() if hasattr(x, "isoformat") else x
                 )
 
-        df_copy.to_csv(csv_filename, index=False, encoding="utf-8")
-        print(f"✓ Data exported to {csv_filename}")
-        print(f"  - Rows: {len(df_copy)}")
-        print(f"  - Columns: {len(df_copy.columns)}")
-        return csv_filename
-
-    def upload_to_azure_blob(self, file_path):
-        """Upload file to Azure Blob Storage"""
-        if not file_path:
-            print("⚠ No file to upload")
+        # Fixed mtime keeps the gzip output identical for identical data
+        with gzip.GzipFile(
+            fileobj=buf, mode="wb", compresslevel=CSV_GZIP_LEVEL, mtime=0
+        ) as gz:
+            text = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+            write_csv(df, text, overrides)
+            text.flush()
+            text.detach()
+        buf.seek(0)
+        print(f"✓ Data exported to {self.blob_name}")
+        print(f"  - Rows: {len(df)}")
+        print(f"  - Columns: {len(df.columns)}")
+        return buf
+
+    def upload_to_azure_blob(self, buf):
+        """Upload an in-memory export buffer to Azure Blob Storage"""
+        if not buf:
+            print("⚠ No data to upload")
             return None
 
         print("Connecting to Azure Blob Storage...")
-        blob_service_client = BlobServiceClient.from_connection_string(
-            self.azure_connection_string
-        )
+        blob_service_client = _blob_service(self.azure_connection_string)
 
         # Get blob client
         blob_client = blob_service_client.get_blob_client(
             container=self.container_name, blob=self.blob_name
         )
 
-        # Upload file (overwrite if exists)
-        print(f"Uploading {file_path} to Azure Blob Storage...")
-        with open(file_path, "rb") as data:
-            blob_client.upload_blob(data, overwrite=True)
+        # Upload buffer (overwrite if exists), blocks sent in parallel
+        size = buf.getbuffer().nbytes
+        print(f"Uploading {self.blob_name} ({size} bytes) to Azure Blob Storage...")
+        blob_client.upload_blob(
+            buf,
+            overwrite=True,
+            length=size,
+            blob_type=BlobType.BLOCKBLOB,
+            max_concurrency=AZURE_MAX_CONCURRENCY,
+            content_settings=ContentSettings(
+                content_type=self.content_type,
+                content_encoding=self.content_encoding,
+            ),
+        )
 
         # Generate the public URL (if container is public) or SAS URL
         blob_url = f"https://{blob_service_client.account_name}.blob.core.windows.net/{self.container_name}/{self.blob_name}"
@@ -190,43 +533,55 @@ class DataExportJob:
 
         return blob_url
 
+    def _export_and_upload(self, df):
+        """Export data and upload it to Azure Blob Storage"""
+        print(f"\n[Step 3] Exporting to {self.export_format}...")
+        export_buf = self.export_to_csv(df)
+
+        if not export_buf:
+            return None
+
+        print("\n[Step 4] Uploading to Azure Blob Storage...")
+        return self.upload_to_azure_blob(export_buf)
+
     def run(self):
         """Main execution flow"""
         try:
+            # Single timestamp shared by the MongoDB documents and the export
+            synced_at = datetime.utcnow()
+
             print("=" * 50)
             print("Starting Data Export Job")
-            print(f"Timestamp: {datetime.utcnow().isoformat()}")
+            print(f"Timestamp: {synced_at.isoformat()}")
             print("=" * 50)
 
             # Step 1: Fetch from PostgreSQL (or API in real scenario)
             print("\n[Step 1] Fetching from PostgreSQL...")
             df_postgres = self.fetch_from_postgres()
 
-            # Step 2: Save to MongoDB
-            print("\n[Step 2] Saving to MongoDB...")
-            self.save_to_mongodb(df_postgres)
-
-            # Step 3: Fetch from MongoDB (this is what gets exported)
-            print("\n[Step 3] Fetching from MongoDB for export...")
-            df_mongo = self.fetch_from_mongodb()
-
-            # Step 4: Export MongoDB data to CSV
-            print("\n[Step 4] Exporting to CSV...")
-            csv_file = self.export_to_csv(df_mongo)
-
-            if not csv_file:
-                print("❌ CSV export failed")
+            # Normalize once: MongoDB stores exactly these values (dates as
+            # midnight datetimes, timestamps as naive UTC, NUMERIC as float,
+            # synced_at added), so the export built from the same frame
+            # matches what a read back from MongoDB would give
+            # (fetch_from_mongodb is kept for verification)
+            df_sync = normalize_frame(df_postgres, synced_at)
+
+            # Steps 2-4 only read df_sync, so the I/O-bound MongoDB sync and
+            # the export + upload run side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                print("\n[Step 2] Saving to MongoDB...")
+                mongo_future = executor.submit(self.save_to_mongodb, df_sync)
+                export_future = executor.submit(self._export_and_upload, df_sync)
+                wait([mongo_future, export_future])
+
+            # Re-raise a failure from either stage
+            mongo_future.result()
+            blob_url = export_future.result()
+
+            if not blob_url:
+                print("❌ Export failed")
                 return
 
-            # Step 5: Upload to Azure Blob Storage
-            print("\n[Step 5] Uploading to Azure Blob Storage...")
-            blob_url = self.upload_to_azure_blob(csv_file)
-
-            # Clean up local CSV file
-            if csv_file and os.path.exists(csv_file):
-                os.remove(csv_file)
-                print(f"✓ Cleaned up local file: {csv_file}")
-
             print("\n" + "=" * 50)
             print("✅ Data Export Job Completed Successfully!")
             print("=" * 50)